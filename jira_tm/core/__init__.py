@@ -1,17 +1,21 @@
 from .checklist_management import ChecklistManager
+from .config import JiraConfig
 from .connection import JiraConnection
 from .constants import ISSUE_TYPE_SUBTASK, ISSUE_TYPE_TASK, STATUS_DONE, STATUS_IN_PROGRESS, STATUS_TODO
 from .core_tasks import CoreTaskOperations
 from .exceptions import ChecklistItemNotFoundError, ChecklistNotFoundError, TaskNotFoundError
 from .status_management import TaskStatusManager
 from .task_querying import TaskQueryManager
+from .transitions import TransitionService
 
 __all__ = [
+    "JiraConfig",
     "JiraConnection",
     "CoreTaskOperations",
     "TaskStatusManager",
     "ChecklistManager",
     "TaskQueryManager",
+    "TransitionService",
     "TaskNotFoundError",
     "ChecklistNotFoundError",
     "ChecklistItemNotFoundError",
@@ -0,0 +1,61 @@
+from .constants import DESCRIPTION_CACHE_SIZE
+from .utils import TTLCache
+
+# Plain-text descriptions keyed by (issue key, updated timestamp)
+_description_cache = TTLCache(DESCRIPTION_CACHE_SIZE)
+
+
+def _iter_text(node):
+    """Yield the text of every text node in an ADF tree, in document order."""
+    if node.get("type") == "text":
+        yield node.get("text", "")
+    for child in node.get("content", ()):
+        yield from _iter_text(child)
+
+
+def adf_paragraph(*lines):
+    """Build an ADF paragraph with lines separated by hard breaks."""
+    content = []
+    for line in lines:
+        if not line:
+            continue
+        if content:
+            content.append({"type": "hardBreak"})
+        content.append({"type": "text", "text": line})
+    return {"type": "paragraph", "content": content}
+
+
+def adf_document(*blocks):
+    """Build an ADF document from top-level blocks."""
+    return {"type": "doc", "version": 1, "content": list(blocks)}
+
+
+def adf_text(text):
+    """Build a single-paragraph ADF document holding text."""
+    return adf_document(adf_paragraph(text))
+
+
+def adf_to_text(document):
+    """Extract plain text from an Atlassian Document Format document."""
+    if not document:
+        return ""
+    return " ".join(_iter_text(document))
+
+
+def issue_description_text(issue):
+    """Extract plain text from an issue's description, reusing earlier results for unchanged issues."""
+    fields = issue["fields"]
+    description = fields.get("description")
+    if not description:
+        return ""
+
+    updated = fields.get("updated")
+    if updated is None:
+        return adf_to_text(description)
+
+    cache_key = (issue["key"], updated)
+    text = _description_cache.get(cache_key)
+    if text is None:
+        text = adf_to_text(description)
+        _description_cache.set(cache_key, text)
+    return text
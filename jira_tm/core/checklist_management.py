@@ -1,28 +1,30 @@
+import orjson
+import requests
+
 from .connection import JiraConnection
-from .constants import ISSUE_TYPE_SUBTASK, STATUS_DONE
+from .constants import BULK_CREATE_BATCH_SIZE, ISSUE_TYPE_SUBTASK, JQL, STATUS_DONE, TITLE_SEARCH_CANDIDATES
 from .exceptions import ChecklistItemNotFoundError, ChecklistNotFoundError, TaskNotFoundError
+from .transitions import TransitionService
+from .utils import jql_quote, prefer_exact_summary
 
 
 class ChecklistManager:
-    def __init__(self, connection: JiraConnection):
+    def __init__(self, connection: JiraConnection, transitions: TransitionService | None = None):
         self.connection = connection
+        self.transitions = transitions or TransitionService(connection)
 
     def update_task_with_checklist(self, project_name, title, checklist_items):
         """Add or append checklist items as subtasks."""
         # Find the parent issue by title
-        jql = f'project = {self.connection.project_key} AND summary ~ "{title}"'
-        issues = self.connection._search_issues(jql, max_results=1)
-
-        if not issues:
+        parent_issue = self.connection._find_issue_by_title(title, fields=["summary"])
+        if not parent_issue:
             raise TaskNotFoundError(project_name, title)
 
-        parent_issue = issues[0]
         parent_key = parent_issue["key"]
 
-        # Create subtasks for each checklist item
-        created_subtasks = []
-        for item in checklist_items:
-            data = {
+        # Create subtasks in bulk, one request per batch of checklist items
+        issue_updates = [
+            {
                 "fields": {
                     "project": {"key": self.connection.project_key},
                     "parent": {"key": parent_key},
@@ -30,45 +32,60 @@ class ChecklistManager:
                     "summary": item,
                 }
             }
+            for item in checklist_items
+        ]
 
-            result = self.connection._make_request("POST", "/issue", data=data)
-            if result:
-                created_subtasks.append(result["key"])
-
-        return (
-            parent_issue,
-            f"Created {len(created_subtasks)} checklist items as subtasks for task '{title}' in project '{project_name}'.",
-        )
+        batches = [
+            issue_updates[start : start + BULK_CREATE_BATCH_SIZE]
+            for start in range(0, len(issue_updates), BULK_CREATE_BATCH_SIZE)
+        ]
+        created_subtasks = []
+        failed_items = []
+        individual_updates = []
+        for batch, result in zip(batches, self.connection._map_concurrently(self._create_subtasks, batches)):
+            if result is None:
+                individual_updates.extend(batch)
+                continue
+            created_subtasks.extend(issue["key"] for issue in result.get("issues", []))
+            # Bulk create reports rejected items by their position in the batch
+            failed_items.extend(
+                batch[error["failedElementNumber"]]["fields"]["summary"] for error in result.get("errors", [])
+            )
+
+        # Bulk create is unavailable, so create the items individually; this runs at the top
+        # level rather than per batch so nested pools don't multiply the concurrency cap
+        if individual_updates:
+            created = self.connection._map_concurrently(self._create_subtask, individual_updates)
+            created_subtasks.extend(issue["key"] for issue in created if issue)
+
+        message = f"Created {len(created_subtasks)} checklist items as subtasks for task '{title}' in project '{project_name}'."
+        if failed_items:
+            message += f" Failed to create {len(failed_items)} checklist items: {', '.join(failed_items)}."
+        return parent_issue, message
 
     def complete_checklist_item(self, project_name, title, checklist_item_name):
         """Complete a checklist item (transition subtask to 'Done')."""
-        # Find the parent issue
-        jql = f'project = {self.connection.project_key} AND summary ~ "{title}"'
-        issues = self.connection._search_issues(jql, max_results=1)
-
-        if not issues:
+        # Find the parent issue, usually served from the title caches
+        parent_issue = self.connection._find_issue_by_title(title, fields=["summary"])
+        if not parent_issue:
             raise TaskNotFoundError(project_name, title)
 
-        parent_key = issues[0]["key"]
+        parent_key = parent_issue["key"]
 
-        # Find the subtask by name
-        jql = f'parent = {parent_key} AND summary ~ "{checklist_item_name}"'
-        subtasks = self.connection._search_issues(jql, max_results=1)
+        # Find the subtask by name, along with its available transitions
+        jql = JQL.SUBTASK_BY_SUMMARY % (parent_key, jql_quote(checklist_item_name))
+        subtasks = self.connection._search_issues(
+            jql, fields=["summary", "status", "issuetype"], max_results=TITLE_SEARCH_CANDIDATES, expand=["transitions"]
+        )
 
-        if not subtasks:
+        subtask = prefer_exact_summary(subtasks, checklist_item_name)
+        if not subtask:
             raise ChecklistNotFoundError(checklist_item_name, title)
 
-        subtask = subtasks[0]
-        subtask_key = subtask["key"]
-
-        # Find transition ID for "Done"
-        transition_id = self._find_transition_id(subtask_key, STATUS_DONE)
-        if not transition_id:
+        # Transition to "Done"
+        if not self.transitions.transition_to(subtask, STATUS_DONE):
             return subtask, f"Cannot complete checklist item '{checklist_item_name}' (transition not available)"
 
-        # Perform transition
-        self._transition_issue(subtask_key, transition_id)
-
         return (
             subtask,
             f"Checklist item '{checklist_item_name}' in task '{title}' in project '{project_name}' completed.",
@@ -77,17 +94,15 @@ class ChecklistManager:
     def get_next_unchecked_checklist_item(self, project_name, title):
         """Get the first incomplete checklist item/subtask."""
         # Find the parent issue
-        jql = f'project = {self.connection.project_key} AND summary ~ "{title}"'
-        issues = self.connection._search_issues(jql, max_results=1)
-
-        if not issues:
+        parent_issue = self.connection._find_issue_by_title(title, fields=["summary"])
+        if not parent_issue:
             raise TaskNotFoundError(project_name, title)
 
-        parent_key = issues[0]["key"]
+        parent_key = parent_issue["key"]
 
         # Find incomplete subtasks
-        jql = f'parent = {parent_key} AND status != "{STATUS_DONE}" ORDER BY created ASC'
-        subtasks = self.connection._search_issues(jql, max_results=1)
+        jql = JQL.OPEN_SUBTASKS % parent_key
+        subtasks = self.connection._search_issues(jql, fields=["summary"], max_results=1)
 
         if not subtasks:
             raise ChecklistItemNotFoundError(title)
@@ -97,20 +112,23 @@ class ChecklistManager:
 
         return subtask, f"Next unchecked checklist item for task '{title}': {item_name}"
 
-    def _find_transition_id(self, issue_key, target_status):
-        """Find transition ID for target status."""
-        transitions = self._get_transitions(issue_key)
-        for transition in transitions:
-            if transition["to"]["name"] == target_status:
-                return transition["id"]
-        return None
-
-    def _get_transitions(self, issue_key):
-        """Get available transitions for an issue."""
-        result = self.connection._make_request("GET", f"/issue/{issue_key}/transitions")
-        return result.get("transitions", []) if result else []
-
-    def _transition_issue(self, issue_key, transition_id):
-        """Transition an issue to a new status."""
-        data = {"transition": {"id": transition_id}}
-        return self.connection._make_request("POST", f"/issue/{issue_key}/transitions", data=data)
+    def _create_subtasks(self, issue_updates):
+        """Create a batch of subtasks in a single bulk request, returning None if bulk create is unavailable."""
+        try:
+            return self.connection._make_request("POST", "/issue/bulk", data={"issueUpdates": issue_updates})
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 400:
+                raise
+
+            # When every item is rejected the batch fails with 400, but carries the same per-item errors
+            try:
+                errors = orjson.loads(e.response.content).get("errors")
+            except orjson.JSONDecodeError:
+                errors = None
+            if not errors:
+                raise
+            return {"issues": [], "errors": errors}
+
+    def _create_subtask(self, issue_update):
+        """Create a single subtask."""
+        return self.connection._make_request("POST", "/issue", data=issue_update)
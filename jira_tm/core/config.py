@@ -0,0 +1,29 @@
+import os
+from dataclasses import dataclass
+
+from dotenv import load_dotenv
+
+_dotenv_loaded = False
+
+
+@dataclass(frozen=True)
+class JiraConfig:
+    server_url: str
+    username: str
+    api_token: str
+    project_key: str
+
+    @classmethod
+    def from_env(cls):
+        """Build configuration from JIRA_* environment variables, loading .env on first use."""
+        global _dotenv_loaded
+        if not _dotenv_loaded:
+            load_dotenv()
+            _dotenv_loaded = True
+
+        return cls(
+            server_url=os.getenv("JIRA_SERVER_URL"),
+            username=os.getenv("JIRA_USERNAME"),
+            api_token=os.getenv("JIRA_API_TOKEN"),
+            project_key=os.getenv("JIRA_PROJECT_KEY"),
+        )
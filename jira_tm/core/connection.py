@@ -1,26 +1,82 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
 import requests
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 
-from .constants import JIRA_API_TOKEN, JIRA_PROJECT_KEY, JIRA_SERVER_URL, JIRA_USERNAME
+from .config import JiraConfig
+from .constants import (
+    ISSUE_KEY_CACHE_TTL,
+    ISSUE_LOOKUP_CACHE_SIZE,
+    ISSUE_LOOKUP_CACHE_TTL,
+    JQL,
+    MAX_CONCURRENT_REQUESTS,
+    SEARCH_PAGE_SIZE,
+    TITLE_SEARCH_CANDIDATES,
+)
+from .utils import TTLCache, jql_quote, prefer_exact_summary
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
 
 class JiraConnection:
-    def __init__(self):
-        self.server_url = JIRA_SERVER_URL
-        self.auth = HTTPBasicAuth(JIRA_USERNAME, JIRA_API_TOKEN)
-        self.project_key = JIRA_PROJECT_KEY
+    def __init__(self, config: JiraConfig | None = None, verify=False, max_workers=None):
+        self.config = config or JiraConfig.from_env()
+        self.server_url = self.config.server_url
+        self.auth = HTTPBasicAuth(self.config.username, self.config.api_token)
+        self.project_key = self.config.project_key
         self.base_url = f"{self.server_url}/rest/api/3"
+        self.max_workers = max_workers or MAX_CONCURRENT_REQUESTS
+
+        # Fields returned by searches that don't ask for specific ones
+        self._default_fields = ("summary", "description", "status", "issuetype")
+
+        # Offset search page size, lowered to whatever cap the server reports on first use
+        self._search_page_size = SEARCH_PAGE_SIZE
+
+        # Reuse pooled keep-alive connections across API calls
+        self._session = self._create_session()
+
+        # Recent title lookups, so back-to-back operations on one task skip the JQL search
+        self._issue_lookup_cache = TTLCache(ISSUE_LOOKUP_CACHE_SIZE, ISSUE_LOOKUP_CACHE_TTL)
+        self._issue_key_cache = TTLCache(ISSUE_LOOKUP_CACHE_SIZE, ISSUE_KEY_CACHE_TTL)
+
+        # Verification costs a round trip; by default the first real API call surfaces connection errors
+        if verify:
+            self.verify()
+
+    def _create_session(self):
+        """Create an HTTP session with connection pooling and retries."""
+        session = requests.Session()
+        session.auth = self.auth
+        session.headers.update({"Content-Type": "application/json", "Accept": "application/json"})
+
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        # Keep at least one pooled connection per worker so concurrent calls reuse connections
+        adapter = HTTPAdapter(
+            pool_connections=10, pool_maxsize=max(20, self.max_workers), max_retries=retries, pool_block=False
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def close(self):
+        """Close the underlying HTTP session."""
+        self._session.close()
 
-        # Verify connection
-        self._verify_connection()
+    def __enter__(self):
+        return self
 
-    def _verify_connection(self):
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def verify(self):
         """Verify JIRA connection and project access."""
         try:
-            response = requests.get(f"{self.base_url}/project/{self.project_key}", auth=self.auth, timeout=10)
+            response = self._session.get(f"{self.base_url}/project/{self.project_key}", timeout=10)
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             raise ConnectionError(f"Failed to connect to JIRA: {e}") from e
@@ -28,28 +84,142 @@ class JiraConnection:
     def _make_request(self, method, endpoint, data=None, params=None):
         """Make HTTP request to JIRA API."""
         url = f"{self.base_url}{endpoint}"
-        headers = {"Content-Type": "application/json"}
 
-        response = requests.request(
-            method=method, url=url, auth=self.auth, headers=headers, json=data, params=params, timeout=30
-        )
+        body = None if data is None else orjson.dumps(data)
+        response = self._session.request(method, url, data=body, params=params, timeout=30, stream=False)
+
+        status_code = response.status_code
+        # Transitions and deletes answer 204 No Content; a missing resource is not an error here
+        if status_code in (204, 404):
+            return None
+        if status_code not in (200, 201):
+            response.raise_for_status()
 
-        if response.status_code == 404:
+        # Skip decoding when the server declares an empty body
+        if response.headers.get("Content-Length") == "0":
             return None
 
-        response.raise_for_status()
+        content = response.content
+        return orjson.loads(content) if content else None
 
-        if response.content:
-            return response.json()
-        return None
+    def _map_concurrently(self, func, items):
+        """Apply func to each item with bounded concurrency, preserving order."""
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
 
-    def _search_issues(self, jql, fields=None, max_results=50):
+        with ThreadPoolExecutor(max_workers=min(len(items), self.max_workers)) as executor:
+            return list(executor.map(func, items))
+
+    def _search_issues(self, jql, fields=None, max_results=50, expand=None):
         """Search for issues using JQL."""
         data = {
             "jql": jql,
             "maxResults": max_results,
-            "fields": fields or ["summary", "description", "status", "issuetype"],
+            "fields": fields or self._default_fields,
+            "fieldsByKeys": False,
         }
+        if expand:
+            data["expand"] = expand
 
         result = self._make_request("POST", "/search", data=data)
         return result.get("issues", []) if result else []
+
+    def _find_issue_by_title(self, title, fields=None, expand=None):
+        """Find the issue in the project whose summary matches title."""
+        fields = fields or self._default_fields
+        cache_key = (title, tuple(fields), tuple(expand or ()))
+        issue = self._issue_lookup_cache.get(cache_key)
+        if issue is not None:
+            return issue
+
+        # A previously resolved key allows a direct lookup instead of a text search
+        issue_key = self._issue_key_cache.get(title)
+        if issue_key is not None:
+            params = {"fields": ",".join(fields)}
+            if expand:
+                params["expand"] = ",".join(expand)
+            issue = self._make_request("GET", f"/issue/{issue_key}", params=params)
+
+        if issue is None:
+            issue = self._search_issue_by_title(title, fields, expand)
+            if issue is None:
+                return None
+            self._issue_key_cache.set(title, issue["key"])
+
+        self._issue_lookup_cache.set(cache_key, issue)
+        return issue
+
+    def _search_issue_by_title(self, title, fields, expand=None):
+        """Search for an issue by title, preferring an exact summary match."""
+        jql = JQL.FIND_BY_SUMMARY % (self.project_key, jql_quote(title))
+        search_fields = fields if "summary" in fields else [*fields, "summary"]
+        issues = self._search_issues(jql, fields=search_fields, max_results=TITLE_SEARCH_CANDIDATES, expand=expand)
+        return prefer_exact_summary(issues, title)
+
+    def _remember_issue_key(self, title, issue_key):
+        """Record the key of a newly created issue so later lookups skip the search."""
+        self._issue_key_cache.set(title, issue_key)
+
+    def _invalidate_issue(self, issue_key):
+        """Drop cached lookups for an issue after it has been modified."""
+        self._issue_lookup_cache.discard_where(lambda issue: issue["key"] == issue_key)
+
+    def _clear_issue_caches(self):
+        """Drop all cached issue lookups, e.g. after issues have been deleted."""
+        self._issue_lookup_cache.clear()
+        self._issue_key_cache.clear()
+
+    def _search_issues_all(self, jql, fields=None, page_size=None):
+        """Search for all issues matching JQL, fetching remaining pages concurrently."""
+        page_size = page_size or self._search_page_size
+        data = {
+            "jql": jql,
+            "startAt": 0,
+            "maxResults": page_size,
+            "fields": fields or self._default_fields,
+            "fieldsByKeys": False,
+        }
+
+        # The first page also reports the total, which lets the rest be fetched in parallel
+        result = self._make_request("POST", "/search", data=data)
+        if not result:
+            return []
+
+        issues = result.get("issues", [])
+        effective_page_size = result.get("maxResults") or page_size
+        if effective_page_size < page_size:
+            logger.debug("JIRA capped search page size at %d (requested %d)", effective_page_size, page_size)
+            page_size = self._search_page_size = effective_page_size
+        offsets = range(len(issues), result.get("total", 0), page_size)
+
+        def fetch_page(start_at):
+            page = self._make_request("POST", "/search", data={**data, "startAt": start_at, "maxResults": page_size})
+            return page.get("issues", []) if page else []
+
+        for page_issues in self._map_concurrently(fetch_page, offsets):
+            issues.extend(page_issues)
+        return issues
+
+    def _iter_issue_ids(self, jql, page_size=SEARCH_PAGE_SIZE):
+        """Yield the id of every issue matching JQL, holding one page of results at a time.
+
+        Uses the token-paged /search/jql endpoint, falling back to offset paging where it is
+        not available (e.g. on Jira Server/Data Center).
+        """
+        data = {"jql": jql, "maxResults": page_size, "fields": ["*none"]}
+
+        result = self._make_request("POST", "/search/jql", data=data)
+        if result is None:
+            for issue in self._search_issues_all(jql, fields=["summary"]):
+                yield issue["id"]
+            return
+
+        while result:
+            for issue in result.get("issues", []):
+                yield issue["id"]
+
+            next_page_token = result.get("nextPageToken")
+            if not next_page_token:
+                break
+            result = self._make_request("POST", "/search/jql", data={**data, "nextPageToken": next_page_token})
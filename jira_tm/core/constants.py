@@ -6,3 +6,28 @@ STATUS_DONE = "Done"
 # Issue types
 ISSUE_TYPE_TASK = "Task"
 ISSUE_TYPE_SUBTASK = "Sub-task"
+
+
+# JQL templates, filled in with %-formatting
+class JQL:
+    PROJECT = "project = %s"
+    PROJECT_TOP_LEVEL = "project = %s AND issuetype not in subTaskIssueTypes()"
+    PROJECT_WITH_STATUS = "project = %s AND status = %s"
+    FIND_BY_SUMMARY = "project = %s AND summary ~ %s"
+    NEXT_TODO = f'status = "{STATUS_TODO}" AND project = %s ORDER BY priority DESC, created ASC'
+    SUBTASK_BY_SUMMARY = "parent = %s AND summary ~ %s"
+    # Matches by category so workflow-specific open statuses (e.g. "In Review") are included
+    OPEN_SUBTASKS = 'parent = %s AND statusCategory in ("To Do", "In Progress") ORDER BY created ASC'
+
+
+# API limits
+BULK_CREATE_BATCH_SIZE = 50
+MAX_CONCURRENT_REQUESTS = 16
+SEARCH_PAGE_SIZE = 500
+TITLE_SEARCH_CANDIDATES = 10
+
+# Caching
+ISSUE_LOOKUP_CACHE_SIZE = 512
+ISSUE_LOOKUP_CACHE_TTL = 30
+ISSUE_KEY_CACHE_TTL = 300
+DESCRIPTION_CACHE_SIZE = 4096
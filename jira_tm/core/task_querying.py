@@ -1,24 +1,43 @@
+from .adf import issue_description_text
 from .connection import JiraConnection
-from .constants import STATUS_DONE, STATUS_IN_PROGRESS
+from .constants import JQL, STATUS_DONE, STATUS_IN_PROGRESS
+from .utils import jql_quote, normalize_status
+
+# Result message templates by filter type
+_NO_TASKS_FMT = {
+    "all": "No tasks found in project '{project_name}'.",
+    "wip": "No work in progress tasks found in project '{project_name}'.",
+    "done": "No completed tasks found in project '{project_name}'.",
+}
+_NO_TASKS_DEFAULT_FMT = "No tasks found with filter '{filter_type}' in project '{project_name}'."
+_FOUND_TASKS_FMT = {
+    "all": "Found {task_count} task(s) in project '{project_name}'.",
+    "wip": "Found {task_count} work in progress task(s) in project '{project_name}'.",
+    "done": "Found {task_count} completed task(s) in project '{project_name}'.",
+}
+_FOUND_TASKS_DEFAULT_FMT = "Found {task_count} task(s) with filter '{filter_type}' in project '{project_name}'"
 
 
 class TaskQueryManager:
     def __init__(self, connection: JiraConnection):
         self.connection = connection
 
-    def get_tasks(self, project_name, filter_type="all"):
-        """Retrieve tasks with filters like all, WIP, done."""
-        # Build JQL based on filter
-        base_jql = f"project = {self.connection.project_key}"
+        # JQL per filter type is fixed for a project, so build it once
+        project_key = connection.project_key
+        self._filter_jql = {
+            "all": JQL.PROJECT % project_key,
+            "wip": JQL.PROJECT_WITH_STATUS % (project_key, jql_quote(STATUS_IN_PROGRESS)),
+            "done": JQL.PROJECT_WITH_STATUS % (project_key, jql_quote(STATUS_DONE)),
+        }
 
-        if filter_type == "wip":
-            jql = f'{base_jql} AND status = "{STATUS_IN_PROGRESS}"'
-        elif filter_type == "done":
-            jql = f'{base_jql} AND status = "{STATUS_DONE}"'
-        else:  # all
-            jql = base_jql
+    def get_tasks(self, project_name, filter_type="all", include_description=False):
+        """Retrieve tasks with filters like all, WIP, done."""
+        # Pick JQL based on filter, defaulting to all tasks in the project
+        jql = self._filter_jql.get(filter_type, self._filter_jql["all"])
 
-        issues = self.connection._search_issues(jql)
+        # Descriptions are large ADF documents, so only fetch them when asked for
+        fields = ["summary", "status", "description", "updated"] if include_description else ["summary", "status"]
+        issues = self.connection._search_issues_all(jql, fields=fields)
 
         # Convert to task dictionaries
         filtered_tasks = []
@@ -26,8 +45,8 @@ class TaskQueryManager:
             status = issue["fields"]["status"]["name"]
             task_dict = {
                 "name": issue["fields"]["summary"],
-                "description": self._get_description_text(issue),
-                "status": self._normalize_status(status),
+                "description": issue_description_text(issue),
+                "status": normalize_status(status),
                 "id": issue["key"],
             }
             filtered_tasks.append(task_dict)
@@ -35,65 +54,27 @@ class TaskQueryManager:
         message = self._generate_result_message(filtered_tasks, filter_type, project_name)
         return filtered_tasks, message
 
-    def _get_description_text(self, issue):
-        """Extract plain text from JIRA description format."""
-        description = issue["fields"].get("description")
-        if not description:
-            return ""
-
-        # Extract text from Atlassian Document Format
-        text_parts = []
-        if "content" in description:
-            for content_block in description["content"]:
-                if content_block.get("type") == "paragraph" and "content" in content_block:
-                    for text_node in content_block["content"]:
-                        if text_node.get("type") == "text":
-                            text_parts.append(text_node.get("text", ""))
-
-        return " ".join(text_parts)
-
-    def _normalize_status(self, jira_status):
-        """Normalize JIRA status to internal status format."""
-        if jira_status == STATUS_DONE:
-            return "done"
-        elif jira_status == STATUS_IN_PROGRESS:
-            return "wip"
-        else:
-            return "todo"
-
     def _generate_result_message(self, filtered_tasks, filter_type, project_name):
         """Generate appropriate result message based on filter and results."""
         if not filtered_tasks:
-            no_tasks_messages = {
-                "all": f"No tasks found in project '{project_name}'.",
-                "wip": f"No work in progress tasks found in project '{project_name}'.",
-                "done": f"No completed tasks found in project '{project_name}'.",
-            }
-            return no_tasks_messages.get(
-                filter_type, f"No tasks found with filter '{filter_type}' in project '{project_name}'."
-            )
+            template = _NO_TASKS_FMT.get(filter_type, _NO_TASKS_DEFAULT_FMT)
         else:
-            task_count = len(filtered_tasks)
-            found_tasks_messages = {
-                "all": f"Found {task_count} task(s) in project '{project_name}'.",
-                "wip": f"Found {task_count} work in progress task(s) in project '{project_name}'.",
-                "done": f"Found {task_count} completed task(s) in project '{project_name}'.",
-            }
-            return found_tasks_messages.get(
-                filter_type, f"Found {task_count} task(s) with filter '{filter_type}' in project '{project_name}'"
-            )
+            template = _FOUND_TASKS_FMT.get(filter_type, _FOUND_TASKS_DEFAULT_FMT)
+        return template.format(task_count=len(filtered_tasks), filter_type=filter_type, project_name=project_name)
 
     def delete_all_tasks(self, project_name: str) -> str:
         """Delete all tasks in a project."""
-        # Search all issues in the project
-        jql = f"project = {self.connection.project_key}"
-        issues = self.connection._search_issues(jql, max_results=1000)
+        # Collect ids before deleting so paging isn't disturbed by the deletions; subtasks
+        # go with their parent (deleteSubtasks=true), so only top-level issues are listed
+        jql = JQL.PROJECT_TOP_LEVEL % self.connection.project_key
+        issue_ids = list(self.connection._iter_issue_ids(jql))
 
-        deleted_count = 0
-        for issue in issues:
-            issue_key = issue["key"]
-            # Delete with subtasks
-            self.connection._make_request("DELETE", f"/issue/{issue_key}?deleteSubtasks=true")
-            deleted_count += 1
+        # Deletes are independent, so issue them concurrently over the pooled session
+        deleted_count = len(self.connection._map_concurrently(self._delete_issue, issue_ids))
+        self.connection._clear_issue_caches()
 
         return f"All {deleted_count} tasks in project '{project_name}' have been deleted."
+
+    def _delete_issue(self, issue_id):
+        """Delete an issue along with its subtasks."""
+        return self.connection._make_request("DELETE", f"/issue/{issue_id}?deleteSubtasks=true")
@@ -0,0 +1,42 @@
+from .connection import JiraConnection
+
+
+def _match_transition(transitions, target_status):
+    """Return the id of the transition leading to target status, if any."""
+    return next((t["id"] for t in transitions if t["to"]["name"] == target_status), None)
+
+
+class TransitionService:
+    def __init__(self, connection: JiraConnection):
+        self.connection = connection
+
+    def transition_to(self, issue, target_status):
+        """Transition an issue to target status, returning False if no such transition is available."""
+        transition_id = self.get_transition_id(issue, target_status)
+        if not transition_id:
+            return False
+
+        self.transition_issue(issue["key"], transition_id)
+        return True
+
+    def get_transition_id(self, issue, target_status):
+        """Find transition ID for target status."""
+        # Transitions depend on per-issue conditions, so prefer the issue's own expanded list; it may
+        # come from the lookup cache though, predating a change (e.g. its last subtask completing)
+        # that made the target reachable, so a miss there is checked against JIRA
+        transition_id = _match_transition(issue.get("transitions") or [], target_status)
+        if transition_id:
+            return transition_id
+        return _match_transition(self._get_transitions(issue["key"]), target_status)
+
+    def transition_issue(self, issue_key, transition_id):
+        """Transition an issue to a new status."""
+        data = {"transition": {"id": transition_id}}
+        result = self.connection._make_request("POST", f"/issue/{issue_key}/transitions", data=data)
+        self.connection._invalidate_issue(issue_key)
+        return result
+
+    def _get_transitions(self, issue_key):
+        """Get available transitions for an issue."""
+        result = self.connection._make_request("GET", f"/issue/{issue_key}/transitions")
+        return result.get("transitions", []) if result else []
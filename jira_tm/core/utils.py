@@ -1,11 +1,71 @@
+import threading
+import time
+from collections import OrderedDict
+
 from .constants import STATUS_DONE, STATUS_IN_PROGRESS
 
+_STATUS_MAP = {STATUS_DONE: "done", STATUS_IN_PROGRESS: "wip"}
+
 
 def normalize_status(jira_status):
     """Normalize JIRA status to internal status format."""
-    if jira_status == STATUS_DONE:
-        return "done"
-    elif jira_status == STATUS_IN_PROGRESS:
-        return "wip"
-    else:
-        return "todo"
+    return _STATUS_MAP.get(jira_status, "todo")
+
+
+def jql_quote(value):
+    """Quote a value as a JQL string literal, escaping backslashes and double quotes."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+def prefer_exact_summary(issues, summary):
+    """Return the issue whose summary equals summary, else the first issue, else None."""
+    if not issues:
+        return None
+    # "~" is a text search and may also match similar summaries
+    return next((issue for issue in issues if issue["fields"]["summary"] == summary), issues[0])
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire ttl seconds after being set."""
+
+    def __init__(self, maxsize, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the cached value for key, or default if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+
+            expires_at, value = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return default
+
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """Cache value under key, evicting the least recently used entries if full."""
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard_where(self, predicate):
+        """Remove every entry whose value matches predicate."""
+        with self._lock:
+            for key in [key for key, (_, value) in self._entries.items() if predicate(value)]:
+                del self._entries[key]
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
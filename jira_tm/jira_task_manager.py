@@ -3,20 +3,37 @@ import datetime
 from .core import (
     ChecklistManager,
     CoreTaskOperations,
+    JiraConfig,
     JiraConnection,
     TaskQueryManager,
     TaskStatusManager,
+    TransitionService,
 )
 
 
 class JiraTaskManager:
-    def __init__(self):
-        self.connection = JiraConnection()
+    def __init__(self, config: JiraConfig | None = None, verify=False, max_workers=None):
+        self.connection = JiraConnection(config, verify=verify, max_workers=max_workers)
         self.core_tasks = CoreTaskOperations(self.connection)
-        self.status_manager = TaskStatusManager(self.connection)
-        self.checklist_manager = ChecklistManager(self.connection)
+        self.transitions = TransitionService(self.connection)
+        self.status_manager = TaskStatusManager(self.connection, self.transitions)
+        self.checklist_manager = ChecklistManager(self.connection, self.transitions)
         self.query_manager = TaskQueryManager(self.connection)
 
+    def verify(self):
+        """Verify JIRA connection and project access."""
+        self.connection.verify()
+
+    def close(self):
+        """Close the pooled JIRA connection."""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     # Core Task Operations
     def add_task(self, project_name, title, description):
         """Create a new task/issue in the project."""
@@ -61,9 +78,9 @@ class JiraTaskManager:
         return self.checklist_manager.get_next_unchecked_checklist_item(project_name, title)
 
     # Task Querying and Filtering
-    def get_tasks(self, project_name, filter_type="all"):
+    def get_tasks(self, project_name, filter_type="all", include_description=False):
         """Retrieve tasks with filters like all, WIP, done."""
-        return self.query_manager.get_tasks(project_name, filter_type)
+        return self.query_manager.get_tasks(project_name, filter_type, include_description)
 
     def delete_all_tasks(self, project_name: str) -> str:
         """Delete all tasks in a project."""
@@ -6,8 +6,6 @@ from mcp.server.fastmcp import Context, FastMCP
 
 from jira_tm.jira_task_manager import JiraTaskManager
 
-load_dotenv()
-
 
 def handle_task_operation(operation_func, error_prefix: str, *args):
     """Generic handler for task operations.
@@ -175,18 +173,21 @@ def _create_task_query_tools(mcp: FastMCP, manager: JiraTaskManager):
     """Create task query tools."""
 
     @mcp.tool()
-    async def get_tasks(ctx: Context, project_name: str, filter_type: str = "all") -> str:
+    async def get_tasks(
+        ctx: Context, project_name: str, filter_type: str = "all", include_description: bool = False
+    ) -> str:
         """Get tasks from a project with optional filtering.
 
         Args:
             project_name: Name of the project
             filter_type: Filter type - 'all' (default), 'wip' (work in progress), or 'done'
+            include_description: Whether to include each task's description (default False)
 
         Returns:
             A formatted list of tasks matching the filter criteria
         """
         try:
-            tasks, message = manager.get_tasks(project_name, filter_type)
+            tasks, message = manager.get_tasks(project_name, filter_type, include_description)
             if not tasks:
                 return message
 
@@ -194,7 +195,8 @@ def _create_task_query_tools(mcp: FastMCP, manager: JiraTaskManager):
             result = [message]
             for i, task in enumerate(tasks, 1):
                 status_emoji = "✅" if task["status"] == "done" else ("🔄" if task["status"] == "wip" else "📋")
-                result.append(f"{i}. {status_emoji} {task['name']} - {task['description']} (Status: {task['status']})")
+                description = f" - {task['description']}" if task["description"] else ""
+                result.append(f"{i}. {status_emoji} {task['name']}{description} (Status: {task['status']})")
 
             return "\n".join(result)
         except Exception as e:
@@ -246,6 +248,7 @@ async def async_main():
 
 
 def main():
+    load_dotenv()
     asyncio.run(async_main())
 
 